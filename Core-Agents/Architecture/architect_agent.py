@@ -5,12 +5,171 @@ Linear Issue: MYT-5
 """
 
 import asyncio
+import copy
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
-from datetime import datetime
 import json
 
 from Base.base_agent import BaseAgent
 from Base.event_bus import EventBus
+from Base.log_utils import get_agent_logger
+from Base.time_utils import now_iso
+
+
+# Constant design templates, built once at import time.
+
+_CODING_STANDARDS_TEMPLATE = {
+    "python": {
+        "style": "PEP 8",
+        "line_length": 88,
+        "imports": "isort",
+        "formatting": "black",
+        "linting": "flake8",
+        "type_hints": "required"
+    },
+    "architecture": {
+        "patterns": ["SOLID", "DRY", "KISS"],
+        "structure": "layered",
+        "communication": "event_driven",
+        "error_handling": "centralized",
+        "logging": "structured"
+    },
+    "testing": {
+        "coverage_minimum": 85,
+        "unit_tests": "required",
+        "integration_tests": "required",
+        "framework": "pytest"
+    },
+    "documentation": {
+        "docstrings": "google_style",
+        "api_docs": "openapi",
+        "architecture_docs": "required"
+    },
+    "security": {
+        "authentication": "required",
+        "authorization": "rbac",
+        "data_encryption": "at_rest_and_transit",
+        "input_validation": "required"
+    },
+    "version": "1.0"
+}
+
+# Bounds for long-running agent state so memory stays flat under sustained load
+_REVIEW_QUEUE_MAXLEN = 1024
+_PERFORMANCE_METRICS_CAP = 256
+
+
+# Fixed-shape design fragments as frozen, slotted dataclasses: a slot load per
+# field instead of a dict probe, one shared instance instead of a fresh dict
+# per design_component call. orjson serializes dataclasses natively if the
+# payloads ever need to leave the process.
+
+@dataclass(slots=True, frozen=True)
+class Interface:
+    """Interface exposed by a designed component"""
+    name: str
+    type: str
+    methods: tuple = ()
+    authentication: str = ""
+    publishes: tuple = ()
+    subscribes: tuple = ()
+
+
+@dataclass(slots=True, frozen=True)
+class DataFlow:
+    """Data flow pattern for a designed component"""
+    input_sources: tuple = ("api_requests", "event_messages", "scheduled_tasks")
+    processing_stages: tuple = ("validation", "business_logic", "persistence")
+    output_destinations: tuple = ("database", "event_bus", "external_apis")
+    error_handling: str = "circuit_breaker_pattern"
+
+
+@dataclass(slots=True, frozen=True)
+class Scalability:
+    """Scalability approach for a designed component"""
+    horizontal_scaling: bool = True
+    load_balancing: str = "round_robin"
+    caching_strategy: str = "redis_cluster"
+    database_sharding: str = "by_tenant"
+    cdn: str = "cloudflare"
+
+
+@dataclass(slots=True, frozen=True)
+class Security:
+    """Security measures for a designed component"""
+    authentication: str = "oauth2"
+    authorization: str = "rbac"
+    encryption: str = "aes_256"
+    network_security: str = "vpc"
+    monitoring: str = "security_events"
+
+
+# Shared immutable singletons for the constant fragments
+_DATA_FLOW = DataFlow()
+_SCALABILITY = Scalability()
+_SECURITY = Security()
+
+
+@lru_cache(maxsize=256)
+def _interfaces_for(component_name: str) -> tuple:
+    """Build the interface skeletons for a component (cached per name)"""
+    return (
+        Interface(
+            name=f"{component_name}_api",
+            type="rest_api",
+            methods=("GET", "POST", "PUT", "DELETE"),
+            authentication="jwt"
+        ),
+        Interface(
+            name=f"{component_name}_events",
+            type="event_interface",
+            publishes=(f"{component_name}.updated", f"{component_name}.error"),
+            subscribes=(f"{component_name}.command",)
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def _api_spec_for(spec_name: str) -> Dict[str, Any]:
+    """Build the OpenAPI skeleton for a specification (cached per name)"""
+    return {
+        "openapi": "3.0.0",
+        "info": {
+            "title": f"{spec_name} API",
+            "version": "1.0.0"
+        },
+        "paths": {
+            f"/{spec_name}": {
+                "get": {"summary": f"Get {spec_name} data"},
+                "post": {"summary": f"Create {spec_name}"}
+            }
+        }
+    }
+
+
+# Shared read-only leaf for every generated data model; MappingProxyType
+# guards it against accidental mutation by consumers
+_MODEL_FIELDS = MappingProxyType({
+    "id": "uuid",
+    "name": "string",
+    "created_at": "timestamp",
+    "updated_at": "timestamp"
+})
+
+
+@lru_cache(maxsize=256)
+def _data_models_for(spec_name: str) -> Dict[str, Any]:
+    """Build the data model skeleton for a specification (cached per name)"""
+    return {
+        f"{spec_name}_model": {
+            "fields": _MODEL_FIELDS,
+            "indexes": ["id", "name"],
+            "constraints": ["unique_name"]
+        }
+    }
 
 
 class ArchitectAgent(BaseAgent):
@@ -23,7 +182,12 @@ class ArchitectAgent(BaseAgent):
     - Ensure architectural consistency across components
     - Plan system evolution and scalability improvements
     """
-    
+
+    __slots__ = ('logger', 'current_architecture', 'specifications', 'coding_standards',
+                 'review_queue', 'performance_metrics', '_pending_requirements',
+                 '_requirements_wake', '_drain_interval', '_requirements_worker',
+                 '_handlers', '_design_hashes')
+
     def __init__(self, agent_id: str, event_bus: EventBus):
         """
         Initialize the Architect Agent
@@ -33,15 +197,39 @@ class ArchitectAgent(BaseAgent):
             event_bus: Shared EventBus instance for communication
         """
         super().__init__(agent_id, event_bus)
-        
+
+        # Deferred, queue-backed logging keeps stdout writes off the event loop
+        self.logger = get_agent_logger(agent_id)
+
         # Architecture state
         self.current_architecture = {}
         self.specifications = {}
         self.coding_standards = self._initialize_coding_standards()
-        self.review_queue = []
-        self.performance_metrics = {}
-        
-        print("🏗️  Architect Agent initialized - Ready to design systems!")
+        # Ring buffer: oldest review entries fall off once the bound is hit
+        self.review_queue = deque(maxlen=_REVIEW_QUEUE_MAXLEN)
+        # LRU-ordered metrics store, capped in _handle_performance_metrics
+        self.performance_metrics = OrderedDict()
+        # Requirements hash per component, for skipping unchanged redesigns
+        self._design_hashes: Dict[str, str] = {}
+
+        # Coalescing work queue for requirements changes: rapid-fire updates
+        # for the same component collapse to the latest message, processed
+        # once per drain interval by a background worker task
+        self._pending_requirements: Dict[str, Dict[str, Any]] = {}
+        self._requirements_wake = asyncio.Event()
+        self._drain_interval = 0.1  # seconds to wait for further updates to coalesce
+        self._requirements_worker: Optional[asyncio.Task] = None
+
+        # Topic dispatch table: O(1) routing instead of an if/elif chain,
+        # and subclasses can register handlers without editing process_message
+        self._handlers = {
+            "system.requirements_changed": self._handle_requirements_change,
+            "development.feedback": self._handle_development_feedback,
+            "performance.metrics": self._handle_performance_metrics,
+            "code.review_request": self._handle_review_request
+        }
+
+        self.logger.info("Architect Agent initialized - ready to design systems")
     
     async def setup_subscriptions(self):
         """Set up EventBus subscriptions for architecture-related topics"""
@@ -51,7 +239,7 @@ class ArchitectAgent(BaseAgent):
         self.subscribe_to_topic("performance.metrics")
         self.subscribe_to_topic("code.review_request")
         
-        print("📋 Architect Agent subscriptions configured")
+        self.logger.info("Architect Agent subscriptions configured")
     
     async def process_message(self, msg_data: Dict[str, Any]):
         """
@@ -60,80 +248,107 @@ class ArchitectAgent(BaseAgent):
         Args:
             msg_data: Message data from EventBus
         """
-        topic = msg_data.get("topic")
-        message = msg_data.get("message")
+        # topic/message are always present in bus envelopes; plain indexing
+        # skips the .get fallback machinery on the hot path
+        topic = msg_data["topic"]
+        message = msg_data["message"]
         source = msg_data.get("source")
-        
-        print(f"🏗️  Architect processing: {topic} from {source}")
+
+        self.logger.debug("Architect processing: %s from %s", topic, source)
         
         try:
-            if topic == "system.requirements_changed":
-                await self._handle_requirements_change(message)
-            elif topic == "development.feedback":
-                await self._handle_development_feedback(message)
-            elif topic == "performance.metrics":
-                await self._handle_performance_metrics(message)
-            elif topic == "code.review_request":
-                await self._handle_review_request(message)
+            handler = self._handlers.get(topic)
+            if handler:
+                await handler(message)
             else:
-                print(f"⚠️  Unknown topic received: {topic}")
-                
+                self.logger.warning("Unknown topic received: %s", topic)
+
         except Exception as e:
-            print(f"❌ Error processing {topic}: {e}")
+            self.logger.error("Error processing %s: %s", topic, e)
             await self.on_error(e, msg_data)
     
     async def on_start(self):
         """Initialize architect agent on startup"""
-        print("🚀 Architect Agent starting up...")
-        
-        # Initialize default architecture
-        await self.design_component("core_system", {
-            "type": "microservices",
-            "components": ["event_bus", "agents", "data_layer"],
-            "patterns": ["observer", "factory", "strategy"]
-        })
-        
-        # Generate initial specifications
-        await self.generate_specification("system_overview", {
-            "architecture_type": "event_driven_microservices",
-            "communication": "event_bus",
-            "scalability": "horizontal"
-        })
-        
-        print("✅ Architect Agent startup complete")
+        self.logger.info("Architect Agent starting up")
+
+        # Start the coalescing worker for requirements changes
+        self._requirements_worker = asyncio.create_task(self._drain_pending_requirements())
+
+        # Initialize default architecture and initial specifications; the two
+        # are independent, so run them concurrently instead of back to back
+        await asyncio.gather(
+            self.design_component("core_system", {
+                "type": "microservices",
+                "components": ["event_bus", "agents", "data_layer"],
+                "patterns": ["observer", "factory", "strategy"]
+            }),
+            self.generate_specification("system_overview", {
+                "architecture_type": "event_driven_microservices",
+                "communication": "event_bus",
+                "scalability": "horizontal"
+            })
+        )
+
+        self.logger.info("Architect Agent startup complete")
     
     async def on_stop(self):
         """Cleanup on agent shutdown"""
-        print("🛑 Architect Agent shutting down...")
-        
+        self.logger.info("Architect Agent shutting down")
+
+        # Process any still-pending requirements, then stop the worker
+        for message in self._drain_snapshot():
+            await self._process_requirements_change(message)
+
+        if self._requirements_worker:
+            self._requirements_worker.cancel()
+            try:
+                await self._requirements_worker
+            except asyncio.CancelledError:
+                pass
+            self._requirements_worker = None
+
         # Save current state (in real implementation, this would persist to storage)
         final_state = {
             "architecture": self.current_architecture,
             "specifications": self.specifications,
             "standards": self.coding_standards,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
-        print(f"💾 Architecture state saved: {len(self.current_architecture)} components")
-        print("✅ Architect Agent shutdown complete")
+        self.logger.info("Architecture state saved: %d components", len(self.current_architecture))
+        self.logger.info("Architect Agent shutdown complete")
     
-    async def design_component(self, component_name: str, requirements: Dict[str, Any]) -> Dict[str, Any]:
+    async def design_component(self, component_name: str, requirements: Dict[str, Any],
+                               publish: bool = True) -> Dict[str, Any]:
         """
         Create architecture design for a system component
-        
+
         Args:
             component_name: Name of the component to design
             requirements: Component requirements and constraints
-            
+            publish: Whether to publish the design update immediately
+                     (callers batching several events pass False)
+
         Returns:
             Architecture design specification
         """
-        print(f"🎨 Designing component: {component_name}")
-        
+        self.logger.debug("Designing component: %s", component_name)
+
+        # Semantic cache: identical requirements produce an identical design,
+        # so skip the rebuild and announce that nothing changed
+        requirements_key = json.dumps(requirements, sort_keys=True, default=str)
+        if self._design_hashes.get(component_name) == requirements_key:
+            self.logger.debug("Requirements unchanged for '%s' - reusing design", component_name)
+            if publish:
+                await self.publish_message("architecture.design_unchanged", {
+                    "component": component_name
+                })
+            return self.current_architecture[component_name]
+
         # Mock architecture design based on requirements
         design = {
             "component_name": component_name,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "architecture_type": requirements.get("type", "modular"),
             "components": requirements.get("components", []),
             "interfaces": self._generate_interfaces(component_name, requirements),
@@ -149,36 +364,37 @@ class ArchitectAgent(BaseAgent):
             }
         }
         
-        # Store in current architecture
+        # Store in current architecture alongside its requirements hash
         self.current_architecture[component_name] = design
-        
+        self._design_hashes[component_name] = requirements_key
+
         # Publish architecture update
-        await self.publish_message("architecture.design_updated", {
-            "component": component_name,
-            "design": design,
-            "version": "1.0"
-        })
-        
-        print(f"✅ Component '{component_name}' architecture designed")
+        if publish:
+            await self.publish_message(*self._design_updated_event(component_name, design))
+
+        self.logger.debug("Component '%s' architecture designed", component_name)
         return design
     
-    async def generate_specification(self, spec_name: str, requirements: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate_specification(self, spec_name: str, requirements: Dict[str, Any],
+                                     publish: bool = True) -> Dict[str, Any]:
         """
         Generate detailed technical specification
-        
+
         Args:
             spec_name: Name of the specification
             requirements: Specification requirements
-            
+            publish: Whether to publish the specification immediately
+                     (callers batching several events pass False)
+
         Returns:
             Technical specification document
         """
-        print(f"📋 Generating specification: {spec_name}")
+        self.logger.debug("Generating specification: %s", spec_name)
         
         specification = {
             "name": spec_name,
             "version": "1.0",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "overview": f"Technical specification for {spec_name}",
             "requirements": requirements,
             "architecture": {
@@ -209,15 +425,12 @@ class ArchitectAgent(BaseAgent):
         
         # Store specification
         self.specifications[spec_name] = specification
-        
+
         # Publish specification
-        await self.publish_message("architecture.spec_generated", {
-            "specification": spec_name,
-            "document": specification,
-            "format": "json"
-        })
-        
-        print(f"✅ Specification '{spec_name}' generated")
+        if publish:
+            await self.publish_message(*self._spec_generated_event(spec_name, specification))
+
+        self.logger.debug("Specification '%s' generated", spec_name)
         return specification
     
     async def review_architecture(self, review_request: Dict[str, Any]) -> Dict[str, Any]:
@@ -233,13 +446,13 @@ class ArchitectAgent(BaseAgent):
         component = review_request.get("component", "unknown")
         code_path = review_request.get("code_path", "")
         
-        print(f"🔍 Reviewing architecture for: {component}")
+        self.logger.debug("Reviewing architecture for: %s", component)
         
         # Mock architecture review
         review_result = {
             "component": component,
             "code_path": code_path,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "reviewer": self.agent_id,
             "compliance_score": 85,  # Mock score
             "findings": [
@@ -278,7 +491,7 @@ class ArchitectAgent(BaseAgent):
             "status": "completed"
         })
         
-        print(f"✅ Architecture review completed for '{component}' - Score: {review_result['compliance_score']}")
+        self.logger.debug("Architecture review completed for '%s' - score: %s", component, review_result["compliance_score"])
         return review_result
     
     async def update_standards(self, standards_update: Dict[str, Any]) -> Dict[str, Any]:
@@ -291,7 +504,7 @@ class ArchitectAgent(BaseAgent):
         Returns:
             Updated standards document
         """
-        print("📏 Updating coding standards...")
+        self.logger.debug("Updating coding standards")
         
         # Update standards
         for category, updates in standards_update.items():
@@ -301,7 +514,7 @@ class ArchitectAgent(BaseAgent):
                 self.coding_standards[category] = updates
         
         # Add timestamp
-        self.coding_standards["last_updated"] = datetime.now().isoformat()
+        self.coding_standards["last_updated"] = now_iso()
         self.coding_standards["version"] = "2.0"
         
         # Publish standards update
@@ -311,40 +524,80 @@ class ArchitectAgent(BaseAgent):
             "version": "2.0"
         })
         
-        print(f"✅ Coding standards updated - Categories: {list(standards_update.keys())}")
+        self.logger.info("Coding standards updated - categories: %s", list(standards_update.keys()))
         return self.coding_standards
     
     # Private helper methods
     
     async def _handle_requirements_change(self, message: Dict[str, Any]):
-        """Handle system requirements changes"""
-        print("📋 Processing requirements change...")
-        
+        """Queue a requirements change, coalescing repeats for the same component"""
+        self.logger.debug("Queueing requirements change")
+
+        # Later messages for the same component replace earlier ones, so a
+        # burst of updates triggers a single redesign with the latest data
+        key = message.get("project_name") or message.get("component", "system")
+        self._pending_requirements[key] = message
+        self._requirements_wake.set()
+
+    def _drain_snapshot(self) -> List[Dict[str, Any]]:
+        """Take and clear the current pending requirements messages"""
+        pending = list(self._pending_requirements.values())
+        self._pending_requirements.clear()
+        self._requirements_wake.clear()
+        return pending
+
+    async def _drain_pending_requirements(self):
+        """Background worker that processes coalesced requirements changes"""
+        while True:
+            await self._requirements_wake.wait()
+            # Give rapid-fire updates a moment to coalesce before draining
+            await asyncio.sleep(self._drain_interval)
+            for message in self._drain_snapshot():
+                try:
+                    await self._process_requirements_change(message)
+                except Exception as e:
+                    await self.on_error(e, {"topic": "system.requirements_changed",
+                                            "message": message})
+
+    async def _process_requirements_change(self, message: Dict[str, Any]):
+        """Process a single (already deduplicated) requirements change"""
+        self.logger.debug("Processing requirements change")
+
         # For integration test, treat the entire message as requirements
         if "project_name" in message:
             # This is a full project requirements message
             project_name = message.get("project_name", "system")
-            print(f"🏗️  Designing architecture for project: {project_name}")
-            
+            self.logger.debug("Designing architecture for project: %s", project_name)
+
             # Design the system architecture
-            await self.design_component(project_name, message)
-            
+            design = await self.design_component(project_name, message, publish=False)
+
             # Generate specification for the project
-            await self.generate_specification(f"{project_name}_architecture", message)
+            spec_name = f"{project_name}_architecture"
+            specification = await self.generate_specification(spec_name, message, publish=False)
+
+            component = project_name
         else:
             # Legacy handling for component-specific changes
             component = message.get("component", "system")
             new_requirements = message.get("requirements", {})
-            
+
             # Redesign affected components
-            await self.design_component(component, new_requirements)
-            
+            design = await self.design_component(component, new_requirements, publish=False)
+
             # Always generate specification for new requirements
-            await self.generate_specification(f"{component}_spec", new_requirements)
+            spec_name = f"{component}_spec"
+            specification = await self.generate_specification(spec_name, new_requirements, publish=False)
+
+        # Publish both events in one batched call instead of two sequential awaits
+        await self.publish_batch([
+            self._design_updated_event(component, design),
+            self._spec_generated_event(spec_name, specification)
+        ])
     
     async def _handle_development_feedback(self, message: Dict[str, Any]):
         """Handle feedback from development teams"""
-        print("💬 Processing development feedback...")
+        self.logger.debug("Processing development feedback")
         
         feedback_type = message.get("type", "general")
         component = message.get("component", "unknown")
@@ -355,7 +608,7 @@ class ArchitectAgent(BaseAgent):
                 "component": component,
                 "issue": message.get("issue", ""),
                 "priority": message.get("priority", "medium"),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             })
             
             # Trigger architecture review
@@ -366,20 +619,23 @@ class ArchitectAgent(BaseAgent):
     
     async def _handle_performance_metrics(self, message: Dict[str, Any]):
         """Handle system performance metrics"""
-        print("📊 Processing performance metrics...")
+        self.logger.debug("Processing performance metrics")
         
         component = message.get("component", "system")
         metrics = message.get("metrics", {})
         
-        # Store metrics
+        # Store metrics, keeping the map LRU-ordered and bounded
         self.performance_metrics[component] = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "metrics": metrics
         }
-        
+        self.performance_metrics.move_to_end(component)
+        while len(self.performance_metrics) > _PERFORMANCE_METRICS_CAP:
+            self.performance_metrics.popitem(last=False)
+
         # Check if architecture changes are needed based on performance
         if metrics.get("response_time_ms", 0) > 500:
-            print("⚠️  High response time detected - considering architecture optimization")
+            self.logger.warning("High response time detected - considering architecture optimization")
             await self.design_component(f"{component}_optimized", {
                 "type": "performance_optimized",
                 "current_metrics": metrics,
@@ -388,94 +644,55 @@ class ArchitectAgent(BaseAgent):
     
     async def _handle_review_request(self, message: Dict[str, Any]):
         """Handle architecture review requests"""
-        print("🔍 Processing review request...")
+        self.logger.debug("Processing review request")
         await self.review_architecture(message)
     
+    def _design_updated_event(self, component_name: str, design: Dict[str, Any]) -> tuple:
+        """
+        Build the (topic, payload) event for a completed component design
+
+        The payload stays a plain dict like every other topic's; callers
+        with bulky fan-out can opt into serialize_payload explicitly rather
+        than this one topic silently carrying bytes.
+        """
+        return ("architecture.design_updated", {
+            "component": component_name,
+            "design": design,
+            "version": "1.0"
+        })
+
+    def _spec_generated_event(self, spec_name: str, specification: Dict[str, Any]) -> tuple:
+        """Build the (topic, payload) event for a generated specification"""
+        return ("architecture.spec_generated", {
+            "specification": spec_name,
+            "document": specification,
+            "format": "json"
+        })
+
     def _initialize_coding_standards(self) -> Dict[str, Any]:
-        """Initialize default coding standards"""
-        return {
-            "python": {
-                "style": "PEP 8",
-                "line_length": 88,
-                "imports": "isort",
-                "formatting": "black",
-                "linting": "flake8",
-                "type_hints": "required"
-            },
-            "architecture": {
-                "patterns": ["SOLID", "DRY", "KISS"],
-                "structure": "layered",
-                "communication": "event_driven",
-                "error_handling": "centralized",
-                "logging": "structured"
-            },
-            "testing": {
-                "coverage_minimum": 85,
-                "unit_tests": "required",
-                "integration_tests": "required",
-                "framework": "pytest"
-            },
-            "documentation": {
-                "docstrings": "google_style",
-                "api_docs": "openapi",
-                "architecture_docs": "required"
-            },
-            "security": {
-                "authentication": "required",
-                "authorization": "rbac",
-                "data_encryption": "at_rest_and_transit",
-                "input_validation": "required"
-            },
-            "version": "1.0",
-            "last_updated": datetime.now().isoformat()
-        }
-    
-    def _generate_interfaces(self, component_name: str, requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Initialize default coding standards from the shared template"""
+        standards = copy.deepcopy(_CODING_STANDARDS_TEMPLATE)
+        standards["last_updated"] = now_iso()
+        return standards
+
+    def _generate_interfaces(self, component_name: str, requirements: Dict[str, Any]) -> List[Interface]:
         """Generate component interfaces"""
-        return [
-            {
-                "name": f"{component_name}_api",
-                "type": "rest_api",
-                "methods": ["GET", "POST", "PUT", "DELETE"],
-                "authentication": "jwt"
-            },
-            {
-                "name": f"{component_name}_events",
-                "type": "event_interface",
-                "publishes": [f"{component_name}.updated", f"{component_name}.error"],
-                "subscribes": [f"{component_name}.command"]
-            }
-        ]
-    
-    def _design_data_flow(self, component_name: str, requirements: Dict[str, Any]) -> Dict[str, Any]:
+        # Interface instances are frozen, so the cached tuple is shared safely
+        return list(_interfaces_for(component_name))
+
+    def _design_data_flow(self, component_name: str, requirements: Dict[str, Any]) -> DataFlow:
         """Design data flow patterns"""
-        return {
-            "input_sources": ["api_requests", "event_messages", "scheduled_tasks"],
-            "processing_stages": ["validation", "business_logic", "persistence"],
-            "output_destinations": ["database", "event_bus", "external_apis"],
-            "error_handling": "circuit_breaker_pattern"
-        }
-    
-    def _design_scalability(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
+        return _DATA_FLOW
+
+    def _design_scalability(self, requirements: Dict[str, Any]) -> Scalability:
         """Design scalability approach"""
-        return {
-            "horizontal_scaling": True,
-            "load_balancing": "round_robin",
-            "caching_strategy": "redis_cluster",
-            "database_sharding": "by_tenant",
-            "cdn": "cloudflare"
-        }
-    
-    def _design_security(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
+        return _SCALABILITY
+
+    def _design_security(self, requirements: Dict[str, Any]) -> Security:
         """Design security measures"""
-        return {
-            "authentication": "oauth2",
-            "authorization": "rbac",
-            "encryption": "aes_256",
-            "network_security": "vpc",
-            "monitoring": "security_events"
-        }
-    
+        return _SECURITY
+
+
     def _identify_dependencies(self, component_name: str, requirements: Dict[str, Any]) -> List[str]:
         """Identify component dependencies"""
         base_deps = ["event_bus", "database", "logging"]
@@ -483,35 +700,12 @@ class ArchitectAgent(BaseAgent):
         return base_deps + component_deps
     
     def _generate_api_spec(self, spec_name: str, requirements: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate API specification"""
-        return {
-            "openapi": "3.0.0",
-            "info": {
-                "title": f"{spec_name} API",
-                "version": "1.0.0"
-            },
-            "paths": {
-                f"/{spec_name}": {
-                    "get": {"summary": f"Get {spec_name} data"},
-                    "post": {"summary": f"Create {spec_name}"}
-                }
-            }
-        }
-    
+        """Generate API specification (cached; treat the result as read-only)"""
+        return _api_spec_for(spec_name)
+
     def _generate_data_models(self, spec_name: str, requirements: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate data model specifications"""
-        return {
-            f"{spec_name}_model": {
-                "fields": {
-                    "id": "uuid",
-                    "name": "string",
-                    "created_at": "timestamp",
-                    "updated_at": "timestamp"
-                },
-                "indexes": ["id", "name"],
-                "constraints": ["unique_name"]
-            }
-        }
+        """Generate data model specifications (cached; treat the result as read-only)"""
+        return _data_models_for(spec_name)
 
 
 # Test function for the Architect Agent
@@ -566,5 +760,13 @@ async def test_architect_agent():
 
 
 if __name__ == "__main__":
+    # Use uvloop when available - a drop-in event loop that's 2-4x faster
+    # for publish/subscribe workloads like this agent's
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the test
     asyncio.run(test_architect_agent())
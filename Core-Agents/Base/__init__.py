@@ -4,11 +4,13 @@ Base Package
 Contains base classes and utilities for all agents:
 - BaseAgent: Abstract base class for all agents
 - EventBus: Event-driven communication system
+- ShardedEventBus: Topic-partitioned EventBus for CPU-parallel fan-out
 - AgentFactory: Factory for creating agent instances
 """
 
 from .base_agent import BaseAgent
 from .event_bus import EventBus
+from .sharded_event_bus import ShardedEventBus
 from .agent_factory import AgentFactory
 
-__all__ = ['BaseAgent', 'EventBus', 'AgentFactory']
+__all__ = ['BaseAgent', 'EventBus', 'ShardedEventBus', 'AgentFactory']
@@ -1,19 +1,38 @@
 import os
+import asyncio
+import importlib
 import json
-from typing import Dict, Any, List, Optional, Type
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Type, Union
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional fast path, stdlib json works everywhere
+    orjson = None
+
 from Base.base_agent import BaseAgent
 from Base.event_bus import EventBus
-from Architecture.architect_agent import ArchitectAgent
-from CodeGen.code_generator_agent import CodeGeneratorAgent
-from QA.qa_agent import QAAgent
-from Documentation.docs_agent import DocumentationAgent
+
+
+@lru_cache(maxsize=32)
+def _load_config_file(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a JSON config file, cached on (path, mtime) so repeated loads of an
+    unchanged project config skip both the read and the parse.
+    """
+    data = Path(path_str).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class AgentFactory:
     """Factory class for creating and managing agent teams for different projects."""
-    
+
+    # Agent types whose constructors take a config parameter
+    _AGENTS_TAKING_CONFIG = frozenset({"qa", "docs"})
+
     def __init__(self, event_bus: EventBus, config_base_path: str = "projects"):
         """
         Initialize the AgentFactory.
@@ -24,18 +43,41 @@ class AgentFactory:
         """
         self.event_bus = event_bus
         self.config_base_path = Path(config_base_path)
-        self.registered_agents: Dict[str, Type[BaseAgent]] = {}
+        # Values are either agent classes or "module:ClassName" strings that
+        # are imported lazily on first use (see _resolve_agent_class)
+        self.registered_agents: Dict[str, Union[Type[BaseAgent], str]] = {}
+        # Cached name tuple, rebuilt only when the registry changes
+        self._registered_names: tuple = ()
         self._register_core_agents()
-    
+        self._registered_names = tuple(self.registered_agents)
+
     def _register_core_agents(self) -> None:
-        """Register the core agent types."""
+        """Register the core agent types as lazy import paths."""
         self.registered_agents.update({
-            "architect": ArchitectAgent,
-            "codegen": CodeGeneratorAgent,
-            "qa": QAAgent,
-            "docs": DocumentationAgent
+            "architect": "Architecture.architect_agent:ArchitectAgent",
+            "codegen": "CodeGen.code_generator_agent:CodeGeneratorAgent",
+            "qa": "QA.qa_agent:QAAgent",
+            "docs": "Documentation.docs_agent:DocumentationAgent"
         })
-    
+
+    def _resolve_agent_class(self, agent_type: str) -> Type[BaseAgent]:
+        """
+        Resolve a registered agent entry to its class, importing on first use.
+
+        Args:
+            agent_type: Registered agent type name
+
+        Returns:
+            The agent class for the given type
+        """
+        entry = self.registered_agents[agent_type]
+        if isinstance(entry, str):
+            module_name, _, class_name = entry.partition(":")
+            entry = getattr(importlib.import_module(module_name), class_name)
+            # Cache the resolved class so the import cost is paid once
+            self.registered_agents[agent_type] = entry
+        return entry
+
     def register_agent(self, agent_name: str, agent_class: Type[BaseAgent]) -> None:
         """
         Register a custom agent type.
@@ -46,8 +88,9 @@ class AgentFactory:
         """
         if not issubclass(agent_class, BaseAgent):
             raise ValueError(f"Agent class {agent_class} must inherit from BaseAgent")
-        
+
         self.registered_agents[agent_name] = agent_class
+        self._registered_names = tuple(self.registered_agents)
     
     def load_project_config(self, project_name: str) -> Dict[str, Any]:
         """
@@ -67,9 +110,8 @@ class AgentFactory:
         
         if not config_path.exists():
             raise FileNotFoundError(f"Project config not found: {config_path}")
-        
-        with open(config_path, 'r') as f:
-            return json.load(f)
+
+        return _load_config_file(str(config_path), config_path.stat().st_mtime_ns)
     
     def create_agent(self, agent_type: str, config: Dict[str, Any]) -> BaseAgent:
         """
@@ -85,15 +127,15 @@ class AgentFactory:
         Raises:
             ValueError: If agent type is not registered
         """
-        if agent_type not in self.registered_agents:
+        try:
+            agent_class = self._resolve_agent_class(agent_type)
+        except KeyError:
             raise ValueError(f"Unknown agent type: {agent_type}. "
-                           f"Available types: {list(self.registered_agents.keys())}")
-        
-        agent_class = self.registered_agents[agent_type]
+                             f"Available types: {list(self._registered_names)}") from None
         agent_id = config.get("agent_id", f"{agent_type}_agent")
         
         # Special handling for agents that accept config parameter
-        if agent_type in ["qa", "docs"]:
+        if agent_type in self._AGENTS_TAKING_CONFIG:
             return agent_class(agent_id, self.event_bus, config)
         else:
             return agent_class(agent_id, self.event_bus)
@@ -110,15 +152,57 @@ class AgentFactory:
         """
         core_agent_types = ["architect", "codegen", "qa", "docs"]
         agents = {}
-        
+
+        # Hoist the shared dicts so the loop doesn't re-fetch and re-copy them
+        common = project_config.get("common", {})
+        agent_configs = project_config.get("agents", {})
+
         for agent_type in core_agent_types:
-            agent_config = project_config.get("agents", {}).get(agent_type, {})
+            agent_config = agent_configs.get(agent_type, {})
             # Merge project-level config with agent-specific config
-            merged_config = {**project_config.get("common", {}), **agent_config}
+            merged_config = {**common, **agent_config}
             agents[agent_type] = self.create_agent(agent_type, merged_config)
-        
+
         return agents
     
+    async def create_core_agents_async(self, project_config: Dict[str, Any],
+                                       start: bool = True) -> Dict[str, BaseAgent]:
+        """
+        Create the core agent team and start the agents concurrently.
+
+        Instantiation is cheap and stays sequential; the async startup hooks
+        (subscription setup plus each agent's on_start work) are independent,
+        so they run in parallel under asyncio.gather instead of serializing.
+
+        Args:
+            project_config: Project configuration dictionary
+            start: Whether to start the agents after creating them
+
+        Returns:
+            Dictionary mapping agent names to (started) agent instances
+        """
+        agents = self.create_core_agents(project_config)
+        if start:
+            await asyncio.gather(*(agent.start() for agent in agents.values()))
+        return agents
+
+    async def create_project_agents_async(self, project_name: str,
+                                          start: bool = True) -> Dict[str, BaseAgent]:
+        """
+        Create all agents for a project and start them concurrently.
+
+        Args:
+            project_name: Name of the project
+            start: Whether to start the agents after creating them
+
+        Returns:
+            Dictionary mapping agent names to (started) agent instances
+        """
+        agents = self.create_project_agents(project_name)
+        if start:
+            await asyncio.gather(*(agent.start() for agent in agents.values()))
+        return agents
+
     def create_project_agents(self, project_name: str) -> Dict[str, BaseAgent]:
         """
         Create all agents for a specific project based on its configuration.
@@ -136,13 +220,14 @@ class AgentFactory:
         
         # Add any custom agents defined in the project config
         custom_agents = project_config.get("custom_agents", {})
+        common = project_config.get("common", {})
         for agent_name, agent_config in custom_agents.items():
             agent_type = agent_config.get("type")
             if not agent_type:
                 raise ValueError(f"Custom agent '{agent_name}' missing 'type' field")
-            
+
             # Merge project-level config with agent-specific config
-            merged_config = {**project_config.get("common", {}), **agent_config}
+            merged_config = {**common, **agent_config}
             agents[agent_name] = self.create_agent(agent_type, merged_config)
         
         return agents
@@ -154,7 +239,7 @@ class AgentFactory:
         Returns:
             List of available agent type names
         """
-        return list(self.registered_agents.keys())
+        return list(self._registered_names)
     
     def create_agent_team(self, team_config: Dict[str, Dict[str, Any]]) -> Dict[str, BaseAgent]:
         """
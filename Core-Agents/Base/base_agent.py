@@ -5,15 +5,31 @@ Linear Issue: MYT-5
 """
 
 import asyncio
+import logging
+import sys
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from datetime import datetime
 from .event_bus import EventBus
 
+log = logging.getLogger("mtp.agent")
+
 
 class BaseAgent(ABC):
-    """Abstract base class for all MTP agents with EventBus communication"""
-    
+    """
+    Abstract base class for all MTP agents with EventBus communication
+
+    Message contract: the msg_data envelope handed to process_message is
+    immutable after publish (the bus shares one frozen Message across all
+    subscribers and its history). Handlers must not mutate the envelope or
+    the nested payload; copy first if a mutable view is needed.
+    """
+
+    # Slotted layout: fixed attribute offsets instead of a per-instance
+    # __dict__. Subclasses that declare their own __slots__ share the savings.
+    __slots__ = ('agent_id', 'event_bus', 'is_running', 'subscriptions', 'start_time',
+                 '_outbox', '_log_prefix')
+
     def __init__(self, agent_id: str, event_bus: EventBus):
         """
         Initialize the base agent
@@ -25,15 +41,21 @@ class BaseAgent(ABC):
         self.agent_id = agent_id
         self.event_bus = event_bus
         self.is_running = False
-        self.subscriptions = []
+        # Set for O(1) dedup: subscribing twice must not double every fan-out
+        self.subscriptions = set()
         self.start_time = None
-        
-        print(f"🤖 Agent '{agent_id}' initialized")
+        # Messages queued during a handler run, flushed as one batched publish
+        self._outbox = []
+        # Interned once: hot-path log lines pass this ready-made prefix as a
+        # lazy %s arg instead of rebuilding an f-string per call
+        self._log_prefix = sys.intern(f"agent[{agent_id}]")
+
+        log.debug("%s initialized", self._log_prefix)
     
     async def start(self):
         """Start the agent and set up subscriptions"""
         if self.is_running:
-            print(f"⚠️  Agent '{self.agent_id}' is already running")
+            log.warning("%s already running", self._log_prefix)
             return
         
         self.is_running = True
@@ -45,12 +67,12 @@ class BaseAgent(ABC):
         # Run agent-specific startup logic
         await self.on_start()
         
-        print(f"✅ Agent '{self.agent_id}' started successfully")
+        log.info("%s started successfully", self._log_prefix)
     
     async def stop(self):
         """Stop the agent and clean up resources"""
         if not self.is_running:
-            print(f"⚠️  Agent '{self.agent_id}' is not running")
+            log.warning("%s not running", self._log_prefix)
             return
         
         self.is_running = False
@@ -61,7 +83,7 @@ class BaseAgent(ABC):
         # Clear subscriptions (EventBus doesn't have unsubscribe, so we just track them)
         self.subscriptions.clear()
         
-        print(f"🛑 Agent '{self.agent_id}' stopped")
+        log.info("%s stopped", self._log_prefix)
     
     async def publish_message(self, topic: str, message: Any):
         """
@@ -72,37 +94,108 @@ class BaseAgent(ABC):
             message: The message data to publish
         """
         await self.event_bus.publish(topic, message, source=self.agent_id)
-    
+
+    async def publish_batch(self, events):
+        """
+        Publish several messages to the EventBus in a single batched call
+
+        Args:
+            events: List of (topic, message) tuples to publish together
+        """
+        await self.event_bus.publish_many(events, source=self.agent_id)
+
+    def queue_message(self, topic: str, message: Any):
+        """
+        Queue a message for publishing at the end of the current handler
+
+        Handlers that emit several messages can queue them instead of awaiting
+        publish_message per event; handle_message flushes the queue in a single
+        batched publish, so each incoming message costs one bus await.
+
+        Args:
+            topic: The topic to publish to
+            message: The message data to publish
+        """
+        self._outbox.append((topic, message))
+
+    async def flush_outbox(self):
+        """Publish all queued messages as one batch (no-op when empty)"""
+        if self._outbox:
+            events, self._outbox = self._outbox, []
+            await self.event_bus.publish_many(events, source=self.agent_id)
+
     async def handle_message(self, msg_data: Dict[str, Any]):
         """
         Handle incoming messages from EventBus subscriptions
-        
+
         Args:
             msg_data: Message data from EventBus
         """
         try:
-            # Don't process our own messages
-            if msg_data.get("source") == self.agent_id:
-                return
-            
-            # Call agent-specific message processing
+            # Call agent-specific message processing (self-sourced messages
+            # are already filtered out by the subscription wrapper)
             await self.process_message(msg_data)
-            
+
+            # Flush any messages the handler queued instead of publishing
+            await self.flush_outbox()
+
         except Exception as e:
-            print(f"❌ Error in {self.agent_id} handling message: {e}")
+            log.error("%s error handling message: %s", self._log_prefix, e)
             await self.on_error(e, msg_data)
     
+    def _subscription_callback(self):
+        """
+        Build the bus callback for this agent's subscriptions
+
+        The wrapper drops self-sourced messages before handle_message is even
+        called, so a self-publish never allocates a coroutine frame or takes a
+        trip through the scheduler.
+        """
+        agent_id = self.agent_id
+        handle = self.handle_message
+
+        def filtered(msg_data, _agent_id=agent_id, _handle=handle):
+            if msg_data.get("source") == _agent_id:
+                return None
+            return _handle(msg_data)
+
+        return filtered
+
     def subscribe_to_topic(self, topic: str):
         """
         Subscribe to a topic on the EventBus
-        
+
         Args:
             topic: The topic to subscribe to
         """
-        self.event_bus.subscribe(topic, self.handle_message)
-        self.subscriptions.append(topic)
-        print(f"📥 Agent '{self.agent_id}' subscribed to '{topic}'")
-    
+        if topic in self.subscriptions:
+            log.debug("%s already subscribed to '%s'", self._log_prefix, topic)
+            return
+        self.subscriptions.add(topic)
+        self.event_bus.subscribe(topic, self._subscription_callback())
+        log.debug("%s subscribed to '%s'", self._log_prefix, topic)
+
+    def subscribe_to_topics(self, topics):
+        """
+        Subscribe to several topics in one call
+
+        One filtered-callback wrapper is built and shared across the whole
+        batch instead of one per subscribe_to_topic call, and already-held
+        subscriptions are skipped, so registering a class-level topic set is
+        idempotent.
+
+        Args:
+            topics: Iterable of topic names to subscribe to
+        """
+        callback = self._subscription_callback()
+        for topic in topics:
+            if topic in self.subscriptions:
+                continue
+            self.subscriptions.add(topic)
+            self.event_bus.subscribe(topic, callback)
+        log.debug("%s subscriptions now: %s", self._log_prefix,
+                  sorted(self.subscriptions))
+
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
         uptime = None
@@ -114,7 +207,8 @@ class BaseAgent(ABC):
             "is_running": self.is_running,
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "uptime_seconds": uptime,
-            "subscriptions": self.subscriptions.copy()
+            # Sorted tuple snapshot: read-only, deterministic order
+            "subscriptions": tuple(sorted(self.subscriptions))
         }
     
     # Abstract methods that must be implemented by subclasses
@@ -147,6 +241,6 @@ class BaseAgent(ABC):
             error: The exception that occurred
             msg_data: Message data that caused the error (if applicable)
         """
-        print(f"❌ Error in agent '{self.agent_id}': {error}")
-        if msg_data:
-            print(f"   Message: {msg_data}")
+        log.error("%s error: %s", self._log_prefix, error)
+        if msg_data and log.isEnabledFor(logging.DEBUG):
+            log.debug("Failing message: %s", msg_data)
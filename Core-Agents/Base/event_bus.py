@@ -5,53 +5,332 @@ Linear Issue: MYT-5
 """
 
 import asyncio
+import itertools
+import logging
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, List, Callable, Any
-from datetime import datetime
 import json
 
+try:
+    import orjson
+except ImportError:  # optional fast path, stdlib json works everywhere
+    orjson = None
+
+
+try:
+    from Base.time_utils import now_iso
+except ModuleNotFoundError:
+    # Invoked directly as `python Base/event_bus.py`: the package root isn't
+    # on sys.path, so add it and retry; the __main__ test harness below
+    # relies on this module staying runnable as a script
+    import os
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from Base.time_utils import now_iso
+
+log = logging.getLogger("mtp.eventbus")
+
+
+def _json_default(obj):
+    """
+    Coerce payload types neither encoder handles natively
+
+    Real histories carry pre-serialized bytes payloads and read-only
+    mappingproxy views (shared spec/skeleton constants); both encoders
+    would otherwise raise TypeError on the first such message.
+    """
+    if isinstance(obj, bytes):
+        return obj.decode(errors='replace')
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    return str(obj)
+
+
+def serialize_payload(message: Any) -> bytes:
+    """
+    Serialize a payload to bytes once, before publishing
+
+    Publishers with bulky payloads (multi-KB designs, specs) can serialize a
+    single bytes blob that every subscriber shares; consumers that need the
+    structure call orjson/json.loads once, while log-and-forward consumers
+    skip parsing entirely. orjson also handles dataclasses natively.
+    """
+    if orjson is not None:
+        return orjson.dumps(message)
+    return json.dumps(message, default=str).encode()
+
+
+@dataclass(slots=True, frozen=True)
+class Message:
+    """
+    Immutable message envelope shared by every subscriber
+
+    Slots keep the envelope to four fixed fields with no per-instance
+    __dict__, and frozen means the same object can be handed to all
+    subscribers (and kept in history) without defensive copies. The
+    __getitem__/get shims preserve the dict-style access existing
+    handlers use.
+    """
+    timestamp: str
+    topic: str
+    source: str
+    message: Any
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
+class _QueueIterator:
+    """Async iterator draining one pull-mode subscription queue"""
+
+    __slots__ = ('_queue',)
+
+    def __init__(self, queue: asyncio.Queue):
+        self._queue = queue
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Message:
+        return await self._queue.get()
+
+
 class EventBus:
     """Central message hub for all MTP agents"""
     
-    def __init__(self):
-        self.subscribers: Dict[str, List[Callable]] = {}
-        self.message_history: List[Dict] = []
-        print("🚀 MTP EventBus initialized!")
+    # Time window within which batched messages for a topic are coalesced
+    BATCH_INTERVAL = 0.005
+
+    # Bound on retained history, overall and per topic
+    HISTORY_MAXLEN = 10_000
+
+    # A single stuck subscriber must not hang the bus forever
+    CALLBACK_TIMEOUT = 5.0
+
+    # Concurrent publishes in flight before publishers feel backpressure
+    MAX_INFLIGHT = 1024
+
+    def __init__(self, verbose: bool = False):
+        # Topic -> immutable tuple of callbacks. subscribe() rebuilds the
+        # tuple, so dispatch iterates a stable snapshot with no locking and
+        # no defensive copy even if a handler subscribes mid-publish.
+        self.subscribers: Dict[str, tuple] = {}
+        # Ring buffers: old messages fall off once the bound is reached, and
+        # the per-topic index makes topic-filtered history O(limit) not O(N)
+        self.message_history = deque(maxlen=self.HISTORY_MAXLEN)
+        self._history_by_topic = defaultdict(lambda: deque(maxlen=self.HISTORY_MAXLEN))
+        # Per-topic buffers and lazily started flusher tasks for publish_batch
+        self._batch_buffers: Dict[str, List] = {}
+        self._batch_flushers: Dict[str, asyncio.Task] = {}
+        # Publishers block here once too many dispatches are in flight, so
+        # slow consumers surface as backpressure instead of unbounded queues
+        self._inflight = asyncio.Semaphore(self.MAX_INFLIGHT)
+        if verbose:
+            print("🚀 MTP EventBus initialized!")
     
     async def publish(self, topic: str, message: Any, source: str = "system"):
         """Publish message to all subscribers of a topic"""
-        msg_data = {
-            "timestamp": datetime.now().isoformat(),
-            "topic": topic,
-            "source": source,
-            "message": message
-        }
-        
+        msg_data = Message(now_iso(), topic, source, message)
+
         # Store in history
-        self.message_history.append(msg_data)
-        
+        self._record(msg_data)
+
         # Notify subscribers
-        if topic in self.subscribers:
-            print(f"📤 Publishing to {topic}: {message}")
-            for callback in self.subscribers[topic]:
-                await callback(msg_data)
-        
+        subs = self.subscribers.get(topic, ())
+        if subs:
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Publishing to %s: %s", topic, message)
+            async with self._inflight:
+                await self._dispatch(subs, msg_data)
+
         return msg_data
-    
+
+    async def _dispatch(self, subs, msg_data: Message):
+        """
+        Run subscriber callbacks for one message concurrently
+
+        Slow subscribers overlap instead of blocking each other, and one
+        failing handler doesn't keep the rest from seeing the message.
+        """
+        # Callbacks may be plain functions returning a coroutine or None;
+        # a None return means the subscriber declined the message (e.g. the
+        # self-source filter) without ever creating a coroutine frame
+        if len(subs) == 1:
+            # Skip gather overhead for the common single-subscriber case
+            try:
+                coro = subs[0](msg_data)
+                if coro is not None:
+                    await asyncio.wait_for(coro, self.CALLBACK_TIMEOUT)
+            except asyncio.TimeoutError:
+                log.error("Subscriber timed out on '%s' after %ss",
+                          msg_data.topic, self.CALLBACK_TIMEOUT)
+            except Exception as e:
+                log.error("Subscriber error on '%s': %s", msg_data.topic, e)
+            return
+
+        coros = []
+        for callback in subs:
+            try:
+                coro = callback(msg_data)
+            except Exception as e:
+                log.error("Subscriber error on '%s': %s", msg_data.topic, e)
+                continue
+            if coro is not None:
+                coros.append(asyncio.wait_for(coro, self.CALLBACK_TIMEOUT))
+
+        if coros:
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            for result in results:
+                if isinstance(result, asyncio.TimeoutError):
+                    log.error("Subscriber timed out on '%s' after %ss",
+                              msg_data.topic, self.CALLBACK_TIMEOUT)
+                elif isinstance(result, Exception):
+                    log.error("Subscriber error on '%s': %s", msg_data.topic, result)
+
+    async def publish_many(self, events: List[tuple], source: str = "system"):
+        """
+        Publish a batch of (topic, message) events in one call
+
+        Building all envelopes up front and dispatching them in a single pass
+        avoids one event-loop round trip per event when a handler emits
+        several related messages.
+        """
+        timestamp = now_iso()
+        batch = []
+        for topic, message in events:
+            msg_data = Message(timestamp, topic, source, message)
+            self._record(msg_data)
+            batch.append(msg_data)
+
+        # Notify subscribers after all envelopes are recorded
+        for msg_data in batch:
+            subs = self.subscribers.get(msg_data.topic, ())
+            if subs:
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Publishing to %s: %s", msg_data.topic, msg_data.message)
+                await self._dispatch(subs, msg_data)
+
+        return batch
+
+    async def publish_batch(self, topic: str, messages: List[Any], source: str = "system"):
+        """
+        Queue messages on a topic for coalesced delivery
+
+        Messages are buffered per topic and flushed together after a short
+        window (BATCH_INTERVAL), so bursts of related messages amortize the
+        per-message envelope, history and dispatch costs instead of paying
+        them once per publish call.
+        """
+        buffer = self._batch_buffers.setdefault(topic, [])
+        for message in messages:
+            buffer.append((message, source))
+
+        # Start a flusher for this topic if one isn't already pending
+        flusher = self._batch_flushers.get(topic)
+        if flusher is None or flusher.done():
+            self._batch_flushers[topic] = asyncio.create_task(self._flush_batch(topic))
+
+    async def _flush_batch(self, topic: str):
+        """
+        Drain one topic's batch buffer after the coalescing window
+
+        Loops until the buffer is empty: messages queued while a flush is
+        mid-dispatch (publish_batch sees the flusher as still pending and
+        won't schedule another) are picked up on the next pass instead of
+        sitting stranded until the following publish_batch call.
+        """
+        while True:
+            await asyncio.sleep(self.BATCH_INTERVAL)
+
+            pending = self._batch_buffers.get(topic)
+            if not pending:
+                return
+            self._batch_buffers[topic] = []
+
+            # One timestamp and one subscriber snapshot for the whole batch
+            timestamp = now_iso()
+            subs = self.subscribers.get(topic, ())
+            for message, source in pending:
+                msg_data = Message(timestamp, topic, source, message)
+                self._record(msg_data)
+                if subs:
+                    await self._dispatch(subs, msg_data)
+
     def subscribe(self, topic: str, callback: Callable):
         """Subscribe to receive messages on a topic"""
-        if topic not in self.subscribers:
-            self.subscribers[topic] = []
-        
-        self.subscribers[topic].append(callback)
-        print(f"📥 New subscription to '{topic}'")
+        self.subscribers[topic] = self.subscribers.get(topic, ()) + (callback,)
+        log.debug("New subscription to '%s'", topic)
         return True
     
+    def subscribe_iter(self, topic: str, maxsize: int = 1024):
+        """
+        Subscribe in pull mode: iterate messages instead of taking callbacks
+
+        High-volume consumers (e.g. the code.generated burst after a spec)
+        can batch messages in their own loop — `async for msg in
+        bus.subscribe_iter(topic)` — paying one coroutine wakeup per drained
+        queue instead of one per message. The bounded queue gives natural
+        backpressure: when the consumer falls behind, publishers block in
+        dispatch until it catches up. The iterator never terminates on its
+        own; consumers exit their loop when done.
+
+        Args:
+            topic: The topic to pull messages from
+            maxsize: Queue bound before publishers feel backpressure
+
+        Returns:
+            Async iterator yielding Message envelopes for the topic
+        """
+        queue = asyncio.Queue(maxsize)
+        self.subscribe(topic, queue.put)
+        return _QueueIterator(queue)
+
+    def _record(self, msg_data: Message):
+        """Append a message envelope to the overall and per-topic histories"""
+        self.message_history.append(msg_data)
+        self._history_by_topic[msg_data.topic].append(msg_data)
+
     def get_history(self, topic: str = None, limit: int = 10):
         """Get message history"""
-        history = self.message_history
         if topic:
-            history = [m for m in history if m["topic"] == topic]
-        return history[-limit:]
+            history = self._history_by_topic.get(topic)
+            if history is None:
+                return []
+        else:
+            history = self.message_history
+        start = max(0, len(history) - limit)
+        return list(itertools.islice(history, start, len(history)))
+
+    def dump_history(self, path: str):
+        """
+        Export the full message history to a JSON file
+
+        orjson serializes the slotted Message dataclasses natively and emits
+        bytes directly, skipping both dict conversion and the str->bytes
+        encode of the stdlib path; the fallback stays correct everywhere.
+        Payload oddities (bytes, mappingproxy) are coerced by _json_default;
+        the stdlib path converts envelopes shallowly rather than via
+        dataclasses.asdict, whose deepcopy chokes on mappingproxy.
+
+        Args:
+            path: Destination file path (written as bytes)
+        """
+        history = list(self.message_history)
+        if orjson is not None:
+            data = orjson.dumps(history, default=_json_default)
+        else:
+            data = json.dumps(
+                [{'timestamp': msg.timestamp, 'topic': msg.topic,
+                  'source': msg.source, 'message': msg.message}
+                 for msg in history],
+                default=_json_default).encode()
+        with open(path, 'wb') as f:
+            f.write(data)
 
 
 # Test the EventBus
@@ -84,9 +363,28 @@ async def test_eventbus():
     print("\n📜 Message History:")
     for msg in bus.get_history():
         print(f"  - [{msg['timestamp']}] {msg['topic']}: {msg['message']}")
-    
+
+    # Dump a history containing every payload shape agents actually publish:
+    # plain dicts, pre-serialized bytes, and shared mappingproxy views
+    import tempfile
+    from types import MappingProxyType
+    await bus.publish("serialized", serialize_payload({"spec": [1, 2]}), "test")
+    await bus.publish("skeleton", {"view": MappingProxyType({"a": 1})}, "test")
+    with tempfile.NamedTemporaryFile(suffix=".json") as dump:
+        bus.dump_history(dump.name)
+        json.loads(open(dump.name, 'rb').read())
+    print("📦 dump_history round-trip OK")
+
     print("\n✅ EventBus test complete!")
 
 if __name__ == "__main__":
+    # Use uvloop when available - a drop-in event loop that's 2-4x faster
+    # for publish/subscribe workloads like this bus's
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the test
     asyncio.run(test_eventbus())
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+MTP 2.0 - Shared Logging Helpers
+Queue-backed logging so log I/O happens off the event-loop thread
+Linear Issue: MYT-5
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+
+# Single QueueListener shared by all MTP loggers; records are enqueued on the
+# event-loop thread and written out by the listener's background thread
+_listener = None
+
+
+def get_agent_logger(agent_id: str) -> logging.Logger:
+    """
+    Return a logger for an agent, backed by the shared logging queue
+
+    Args:
+        agent_id: Unique identifier of the agent (used as logger suffix)
+    """
+    global _listener
+    if _listener is None:
+        log_queue = queue.SimpleQueue()
+        root = logging.getLogger("MTP")
+        root.setLevel(logging.INFO)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+        _listener.start()
+        atexit.register(_listener.stop)
+
+    return logging.getLogger(f"MTP.{agent_id}")
@@ -0,0 +1,104 @@
+"""
+MTP 2.0 - Sharded Event Bus
+Topic-partitioned EventBus for CPU-parallel fan-out
+Linear Issue: MYT-5
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, List
+
+from Base.event_bus import EventBus
+
+
+class ShardedEventBus:
+    """
+    Partition topics across N EventBus shards, each on its own thread + loop
+
+    A single EventBus serializes every dispatch through one event loop.
+    Sharding by hash(topic) routes each topic to a fixed shard whose loop
+    runs on a dedicated thread, so fan-out for unrelated topics proceeds on
+    separate cores (useful when subscribers do blocking work behind
+    asyncio.to_thread). Ordering is preserved per topic, not across topics.
+
+    This is opt-in: publish() is called from any thread and returns a
+    concurrent.futures.Future; callers that need delivery confirmation call
+    .result() on it, fire-and-forget callers just drop it.
+    """
+
+    N_SHARDS = 4
+
+    def __init__(self, n_shards: int = N_SHARDS, verbose: bool = False):
+        self.n_shards = n_shards
+        self.shards: List[EventBus] = [EventBus(verbose=verbose)
+                                       for _ in range(n_shards)]
+        self._loops: List[asyncio.AbstractEventLoop] = []
+        self._threads: List[threading.Thread] = []
+        for index in range(n_shards):
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever,
+                                      name=f"eventbus-shard-{index}",
+                                      daemon=True)
+            thread.start()
+            self._loops.append(loop)
+            self._threads.append(thread)
+
+    def _shard_index(self, topic: str) -> int:
+        """Map a topic to its owning shard (stable for the process lifetime)"""
+        return hash(topic) % self.n_shards
+
+    def publish(self, topic: str, message: Any, source: str = "system"):
+        """
+        Route a publish to the owning shard's loop (thread-safe)
+
+        Returns:
+            concurrent.futures.Future resolving once the shard dispatched it
+        """
+        index = self._shard_index(topic)
+        return asyncio.run_coroutine_threadsafe(
+            self.shards[index].publish(topic, message, source),
+            self._loops[index])
+
+    def subscribe(self, topic: str, callback: Callable):
+        """Subscribe on the shard that owns the topic"""
+        return self.shards[self._shard_index(topic)].subscribe(topic, callback)
+
+    def _shard_history(self, index: int, topic, limit: int):
+        """
+        Snapshot one shard's history on that shard's own loop
+
+        The shard thread appends to its history deques concurrently, and
+        iterating a deque while another thread mutates it raises
+        RuntimeError; hopping onto the owning loop serializes the read
+        against that shard's dispatches.
+        """
+        async def snapshot():
+            return self.shards[index].get_history(topic, limit)
+
+        return asyncio.run_coroutine_threadsafe(
+            snapshot(), self._loops[index]).result()
+
+    def get_history(self, topic: str = None, limit: int = 10):
+        """
+        Get message history across shards (thread-safe)
+
+        With a topic, this is a read from the owning shard. Without one,
+        the per-shard tails are merged and re-sorted by timestamp. Each
+        read runs on the shard's loop so it never races live dispatch.
+        """
+        if topic:
+            return self._shard_history(self._shard_index(topic), topic, limit)
+        merged = []
+        for index in range(self.n_shards):
+            merged.extend(self._shard_history(index, None, limit))
+        merged.sort(key=lambda msg: msg.timestamp)
+        return merged[-limit:]
+
+    def close(self):
+        """Stop the shard loops and join their threads"""
+        for loop in self._loops:
+            loop.call_soon_threadsafe(loop.stop)
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        for loop in self._loops:
+            loop.close()
@@ -0,0 +1,23 @@
+"""
+MTP 2.0 - Shared Time Helpers
+Cached timestamp formatting for hot event paths
+Linear Issue: MYT-5
+"""
+
+import time
+from datetime import datetime
+
+# Millisecond-bucket cache: callers formatting timestamps within the same
+# millisecond share one string instead of re-running datetime.now().isoformat()
+_cache_bucket = None
+_cache_value = ""
+
+
+def now_iso() -> str:
+    """Return the current local time as an ISO-8601 string, cached per millisecond"""
+    global _cache_bucket, _cache_value
+    bucket = time.monotonic_ns() // 1_000_000
+    if bucket != _cache_bucket:
+        _cache_bucket = bucket
+        _cache_value = datetime.now().isoformat()
+    return _cache_value
@@ -7,6 +7,8 @@ Fixed version with proper imports and EventBus integration
 import asyncio
 from datetime import datetime
 import logging
+import string
+from types import MappingProxyType
 from typing import Dict, Any, List
 
 # Fixed imports using absolute imports (works with sys.path manipulation)
@@ -14,6 +16,36 @@ from Base.base_agent import BaseAgent
 from Base.event_bus import EventBus
 
 
+class _CompiledTemplate:
+    """
+    A {field}-style template parsed once and rendered by concatenation
+
+    str.format re-parses the brace fields on every call; this parses the
+    template a single time with string.Formatter and renders by joining
+    literals and substituted values.
+    """
+
+    __slots__ = ('segments', 'has_docstring')
+
+    def __init__(self, template: str):
+        self.segments = tuple(string.Formatter().parse(template))
+        # Known at compile time, so generated output never needs an
+        # O(len(code)) substring scan to answer it
+        self.has_docstring = any('"""' in (literal or '')
+                                 for literal, _f, _s, _c in self.segments)
+
+    def render(self, params: Dict[str, Any]) -> str:
+        """Render the template; raises KeyError for missing parameters"""
+        parts = []
+        append = parts.append
+        for literal, field, _spec, _conv in self.segments:
+            if literal:
+                append(literal)
+            if field is not None:
+                append(str(params[field]))
+        return ''.join(parts)
+
+
 class CodeGeneratorAgent(BaseAgent):
     """
     Code Generator Agent - L1-C
@@ -28,17 +60,29 @@ class CodeGeneratorAgent(BaseAgent):
         self.logger = logging.getLogger(f"MTP.{self.agent_id}")
         self.logger.setLevel(logging.INFO)
         
-        # Initialize code templates
+        # Initialize code templates (raw sources plus precompiled renderers)
         self.templates = self._initialize_templates()
+        self._compiled = {name: _CompiledTemplate(source)
+                          for name, source in self.templates.items()}
         
-        # Quality standards
-        self.quality_standards = {
+        # Quality standards: small, read-hot, rarely updated — kept as an
+        # immutable view rebuilt on update so it's safe to share across
+        # tasks
+        self.quality_standards = MappingProxyType({
             'line_length': 88,
             'test_coverage': 85,
             'documentation_required': True,
             'type_hints': True
-        }
+        })
         
+        # Topic dispatch table: O(1) routing instead of an if/elif chain
+        self._handlers = {
+            "architecture.spec_generated": self._handle_spec_generated,
+            "development.generation_request": self._handle_generation_request,
+            "code.template_request": self._handle_template_request,
+            "quality.standards_updated": self._handle_standards_update
+        }
+
         self.logger.info("Code Generator Agent initialized with templates and quality standards")
 
     async def setup_subscriptions(self):
@@ -59,28 +103,26 @@ class CodeGeneratorAgent(BaseAgent):
         self.logger.info(f"Processing message from {source} on topic: {topic}")
         
         try:
-            if topic == "architecture.spec_generated":
-                await self._handle_spec_generated(message)
-            elif topic == "development.generation_request":
-                await self._handle_generation_request(message)
-            elif topic == "code.template_request":
-                await self._handle_template_request(message)
-            elif topic == "quality.standards_updated":
-                await self._handle_standards_update(message)
+            handler = self._handlers.get(topic)
+            if handler:
+                await handler(message)
             else:
                 self.logger.warning(f"Unhandled topic: {topic}")
-                
+
         except Exception as e:
             self.logger.error(f"Error processing message: {e}")
             await self.on_error(e, msg_data)
 
-    async def generate_code(self, specification: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate_code(self, specification: Dict[str, Any],
+                            publish: bool = True) -> Dict[str, Any]:
         """
         Generate code from technical specifications
-        
+
         Args:
             specification: Technical specification from architect
-            
+            publish: Whether to publish the result immediately (callers that
+                     batch several results pass False)
+
         Returns:
             Generated code with metadata
         """
@@ -93,16 +135,17 @@ class CodeGeneratorAgent(BaseAgent):
             methods = specification.get('methods', [])
             description = specification.get('description', f'Generated {code_type}')
             
-            # Generate code based on type
-            if code_type == 'class':
-                generated_code = self._generate_class(name, methods, description)
-            elif code_type == 'agent':
-                generated_code = self._generate_agent(name, specification)
-            elif code_type == 'function':
-                generated_code = self._generate_function(name, specification)
+            # Generate code based on type. Trivial specs render inline; larger
+            # ones go to the default thread pool so a multi-ms render burst
+            # doesn't stall every other agent sharing the event loop.
+            if len(methods) < 4:
+                generated_code, has_docstrings = self._render(
+                    code_type, name, methods, description, specification)
             else:
-                generated_code = self._generate_default(name, code_type)
-            
+                generated_code, has_docstrings = await asyncio.to_thread(
+                    self._render, code_type, name, methods, description,
+                    specification)
+
             # Create result with metadata
             result = {
                 'code': generated_code,
@@ -111,21 +154,25 @@ class CodeGeneratorAgent(BaseAgent):
                 'timestamp': datetime.now().isoformat(),
                 'specification': specification,
                 'quality_metrics': {
-                    'lines': len(generated_code.split('\n')),
-                    'has_docstrings': '"""' in generated_code
+                    # count+1 avoids allocating the list split() would build
+                    'lines': generated_code.count('\n') + 1,
+                    'has_docstrings': has_docstrings
                 },
                 'file_path': f"Generated/{name.lower()}.py"
             }
             
             # Publish the generated code to EventBus
-            await self.publish_message('code.generated', result)
-            
+            if publish:
+                await self.publish_message('code.generated', result)
+
             self.logger.info(f"Code generation complete for {name}")
             return result
             
         except Exception as e:
             self.logger.error(f"Error generating code: {e}")
-            # Still publish error result
+            # Still surface the error result; batching callers pass
+            # publish=False and publish the returned dict themselves, so
+            # publishing here too would emit the same error twice
             error_result = {
                 'code': f"# Error generating code: {str(e)}",
                 'type': 'error',
@@ -133,9 +180,31 @@ class CodeGeneratorAgent(BaseAgent):
                 'timestamp': datetime.now().isoformat(),
                 'specification': specification
             }
-            await self.publish_message('code.generated', error_result)
+            if publish:
+                await self.publish_message('code.generated', error_result)
             return error_result
 
+    def _render(self, code_type: str, name: str, methods: List[str],
+                description: str, specification: Dict[str, Any]) -> tuple:
+        """
+        Render the source for one spec (synchronous, thread-pool safe)
+
+        Returns:
+            (code, has_docstring) — the flag comes from the compiled
+            template, precomputed instead of scanning the output
+        """
+        if code_type == 'class':
+            return (self._generate_class(name, methods, description),
+                    self._compiled['class'].has_docstring)
+        elif code_type == 'agent':
+            return (self._generate_agent(name, specification),
+                    self._compiled['agent'].has_docstring)
+        elif code_type == 'function':
+            return (self._generate_function(name, specification),
+                    self._compiled['function'].has_docstring)
+        # The default template always embeds a placeholder docstring
+        return self._generate_default(name, code_type), True
+
     def _initialize_templates(self) -> Dict[str, str]:
         """Initialize code generation templates."""
         return {
@@ -198,30 +267,30 @@ class {name}(BaseAgent):
         # TODO: Implement {method}
         pass''')
         
-        return self.templates['class'].format(
-            name=name,
-            description=description,
-            init_body="pass",
-            methods='\n\n'.join(method_strs) if method_strs else '    pass'
-        )
+        return self._compiled['class'].render({
+            'name': name,
+            'description': description,
+            'init_body': "pass",
+            'methods': '\n\n'.join(method_strs) if method_strs else '    pass'
+        })
 
     def _generate_agent(self, name: str, specification: Dict[str, Any]) -> str:
         """Generate an agent class."""
-        return self.templates['agent'].format(
-            name=name,
-            description=specification.get('description', f'{name} Agent'),
-            agent_id=name.lower().replace(' ', '_')
-        )
+        return self._compiled['agent'].render({
+            'name': name,
+            'description': specification.get('description', f'{name} Agent'),
+            'agent_id': name.lower().replace(' ', '_')
+        })
 
     def _generate_function(self, name: str, specification: Dict[str, Any]) -> str:
         """Generate a function."""
-        return self.templates['function'].format(
-            name=name,
-            params=specification.get('params', ''),
-            return_type=specification.get('return_type', 'None'),
-            description=specification.get('description', f'{name} function'),
-            body=specification.get('body', '    pass')
-        )
+        return self._compiled['function'].render({
+            'name': name,
+            'params': specification.get('params', ''),
+            'return_type': specification.get('return_type', 'None'),
+            'description': specification.get('description', f'{name} function'),
+            'body': specification.get('body', '    pass')
+        })
 
     def _generate_default(self, name: str, code_type: str) -> str:
         """Generate default code when type is not recognized."""
@@ -248,13 +317,12 @@ def {name.lower()}_placeholder():
         if params is None:
             params = {}
         
-        # Get the template
-        if template_name not in self.templates:
+        # Get the precompiled template
+        compiled = self._compiled.get(template_name)
+        if compiled is None:
             self.logger.error(f"Template '{template_name}' not found")
             return f"# Error: Template '{template_name}' not found"
         
-        template = self.templates[template_name]
-        
         # Set up safe default parameters
         safe_params = {
             'name': 'GeneratedCode',
@@ -272,7 +340,7 @@ def {name.lower()}_placeholder():
         
         try:
             # Apply template with parameters
-            result = template.format(**safe_params)
+            result = compiled.render(safe_params)
             self.logger.info(f"Template '{template_name}' applied successfully")
             return result
         except KeyError as e:
@@ -296,14 +364,27 @@ def {name.lower()}_placeholder():
             project_name = specification_doc.get('project_name', 'GeneratedProject')
             
             if components:
-                # Generate code for each component
-                for component in components:
-                    await self.generate_code({
-                        'name': component.get('name', 'Component'),
-                        'type': component.get('type', 'class'),
-                        'methods': component.get('methods', []),
-                        'description': component.get('description', f"Generated component from {project_name}")
-                    })
+                # Build all specs up front, generate the components concurrently
+                # (they are independent of one another), then publish the
+                # results as one coalesced batch instead of one event per
+                # component
+                specs = [{
+                    'name': component.get('name', 'Component'),
+                    'type': component.get('type', 'class'),
+                    'methods': component.get('methods', []),
+                    'description': component.get('description', f"Generated component from {project_name}")
+                } for component in components]
+                results = await asyncio.gather(
+                    *(self.generate_code(spec, publish=False) for spec in specs),
+                    return_exceptions=True
+                )
+                ok = [r for r in results if not isinstance(r, Exception)]
+                for failure in results:
+                    if isinstance(failure, Exception):
+                        self.logger.error(f"Component generation failed: {failure}")
+                if ok:
+                    await self.event_bus.publish_batch('code.generated', ok,
+                                                       source=self.agent_id)
             else:
                 # Generate a main class based on the project
                 await self.generate_code({
@@ -334,6 +415,7 @@ def {name.lower()}_placeholder():
         
         if template_name and template_content:
             self.templates[template_name] = template_content
+            self._compiled[template_name] = _CompiledTemplate(template_content)
             
             result = {
                 "template_name": template_name,
@@ -348,7 +430,8 @@ def {name.lower()}_placeholder():
         """Handle quality standards updates"""
         self.logger.info("Updating quality standards")
         if isinstance(message, dict):
-            self.quality_standards.update(message)
+            merged = {**self.quality_standards, **message}
+            self.quality_standards = MappingProxyType(merged)
             self.logger.info(f"Quality standards updated: {list(message.keys())}")
 
     async def on_start(self):
@@ -398,6 +481,14 @@ async def test_code_generator_agent():
 
 
 if __name__ == "__main__":
+    # Use uvloop when available - a drop-in event loop that's 2-4x faster
+    # for publish/subscribe workloads like this agent's
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the test
     asyncio.run(test_code_generator_agent())
     
\ No newline at end of file
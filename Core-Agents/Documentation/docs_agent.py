@@ -8,15 +8,181 @@ and user guides across multiple formats and programming languages.
 
 import asyncio
 import logging
-import json
+import os
 import re
 import ast
-import inspect
-from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
-from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional
 
 from Base.base_agent import BaseAgent
+from Base.event_bus import serialize_payload
+from Base.time_utils import now_iso
+
+
+# Precompiled once at module load: the hot scan paths skip re's internal
+# 512-entry cache lookup (and its lock) on every call
+_JS_FUNC_RE = re.compile(r'(async\s+)?function\s+([A-Za-z_$][\w$]*)\s*\(')
+_JS_CLASS_RE = re.compile(r'class\s+([A-Za-z_$][\w$]*)')
+
+
+@lru_cache(maxsize=64)
+def _parse_python(code: str) -> ast.AST:
+    """
+    Parse Python source to an AST, cached on the source string
+
+    Compiling source is the dominant cost of any docstring walk, and the
+    same file commonly fires code.generated and then docs.update_request;
+    caching means each distinct source is parsed exactly once.
+    """
+    return ast.parse(code, type_comments=True)
+
+
+# Documentation templates are pure constants: defined once at module scope so
+# every agent instance shares the same interned strings instead of carrying
+# its own ~1KB copies
+_FUNCTION_DOC_TMPL = """
+        Args:
+            {args}
+        
+        Returns:
+            {returns}
+        
+        Raises:
+            {raises}
+        
+        Example:
+            {example}
+        """
+
+_CLASS_DOC_TMPL = """
+        {description}
+        
+        Attributes:
+            {attributes}
+        
+        Methods:
+            {methods}
+        
+        Example:
+            {example}
+        """
+
+_API_DOC_TMPL = """
+        # API Documentation
+        
+        ## Endpoints
+        
+        {endpoints}
+        
+        ## Authentication
+        
+        {auth}
+        
+        ## Examples
+        
+        {examples}
+        """
+
+# Mock API documentation skeleton: identical on every call, so it is built
+# once and shared read-only (bus payloads are immutable after publish)
+_API_SKELETON = MappingProxyType({
+    "openapi": "3.0.0",
+    "info": {
+        "title": "Generated API Documentation",
+        "version": "1.0.0",
+        "description": "Auto-generated API documentation from code analysis"
+    },
+    "paths": {
+        "/api/example": {
+            "get": {
+                "summary": "Example endpoint",
+                "description": "An example API endpoint extracted from code",
+                "responses": {
+                    "200": {
+                        "description": "Successful response",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "message": {"type": "string"},
+                                        "data": {"type": "object"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    },
+    "components": {
+        "schemas": {
+            "ApiResponse": {
+                "type": "object",
+                "properties": {
+                    "success": {"type": "boolean"},
+                    "message": {"type": "string"},
+                    "data": {"type": "object"}
+                }
+            }
+        }
+    }
+})
+
+# Serialized once at import: consumers that just forward or persist the
+# skeleton reuse these bytes instead of re-encoding the same structure on
+# every request (serialize_payload picks orjson when available)
+_API_SKELETON_JSON = serialize_payload(dict(_API_SKELETON))
+
+# Bound on the per-agent generated-docs cache
+_DOC_CACHE_MAX = 512
+
+# Shared empty-case string so the common no-features call allocates nothing
+_EMPTY_FEATURES = "- No features specified"
+
+# Static README tail: everything after the feature list never varies
+_README_TAIL = """
+## Installation
+
+```bash
+# Installation instructions here
+```
+
+## Usage
+
+```python
+# Usage examples here
+```
+
+## Contributing
+
+Please read CONTRIBUTING.md for details on our code of conduct and the process for submitting pull requests.
+
+## License
+
+This project is licensed under the MIT License - see the LICENSE file for details.
+"""
+
+_README_TMPL = """
+        # {title}
+        
+        {description}
+        
+        ## Installation
+        
+        {installation}
+        
+        ## Usage
+        
+        {usage}
+        
+        ## Contributing
+        
+        {contributing}
+        """
 
 
 class DocumentationAgent(BaseAgent):
@@ -24,6 +190,24 @@ class DocumentationAgent(BaseAgent):
     Documentation Agent that automatically generates comprehensive documentation
     from code, architecture designs, and test results.
     """
+
+    # Configuration defaults, shared and immutable (tuple for the formats so
+    # the default can never be mutated through one instance)
+    _DEFAULTS = {
+        'supported_formats': ('markdown', 'rst', 'html'),
+        'default_format': 'markdown',
+        'include_examples': True,
+        'generate_diagrams': True
+    }
+
+    # Shared by all instances; construction no longer calls four template
+    # methods or allocates a fresh dict per agent
+    TEMPLATES = {
+        'function_doc': _FUNCTION_DOC_TMPL,
+        'class_doc': _CLASS_DOC_TMPL,
+        'api_doc': _API_DOC_TMPL,
+        'readme': _README_TMPL
+    }
     
     def __init__(self, agent_id: str, event_bus, config: Optional[Dict[str, Any]] = None):
         """
@@ -36,42 +220,51 @@ class DocumentationAgent(BaseAgent):
         """
         super().__init__(agent_id, event_bus)
         
-        # Set up logging
+        # Set up logging (level is left to the root config)
         self.logger = logging.getLogger(f"MTP.{self.agent_id}")
-        self.logger.setLevel(logging.INFO)
-        
-        # Documentation-specific configuration
-        self.supported_formats = config.get('supported_formats', ['markdown', 'rst', 'html']) if config else ['markdown', 'rst', 'html']
-        self.default_format = config.get('default_format', 'markdown') if config else 'markdown'
-        self.include_examples = config.get('include_examples', True) if config else True
-        self.generate_diagrams = config.get('generate_diagrams', True) if config else True
-        
-        # Documentation templates
-        self.templates = {
-            'function_doc': self._get_function_doc_template(),
-            'class_doc': self._get_class_doc_template(),
-            'api_doc': self._get_api_doc_template(),
-            'readme': self._get_readme_template()
+        
+        # Documentation-specific configuration: one merge against the shared
+        # defaults instead of a truthiness check and inline default per key
+        cfg = {**self._DEFAULTS, **(config or {})}
+        self.supported_formats = list(cfg['supported_formats'])
+        self.default_format = cfg['default_format']
+        self.include_examples = cfg['include_examples']
+        self.generate_diagrams = cfg['generate_diagrams']
+        
+        # Documentation templates (shared class-level constants)
+        self.templates = self.TEMPLATES
+
+        # Language dispatch: one .lower() and one dict lookup per request,
+        # scaling to new languages without another elif
+        self._lang_dispatch = {
+            "python": self._generate_python_docs,
+            "javascript": self._generate_javascript_docs
+        }
+
+        # Topic dispatch table: O(1) routing instead of an if/elif chain
+        self._topic_handlers = {
+            "code.generated": self._handle_code_generated,
+            "architecture.spec_generated": self._handle_architecture_spec,
+            "test.results": self._handle_test_results,
+            "docs.generate_request": self._handle_docs_request,
+            "docs.update_request": self._handle_docs_update
         }
         
+        # Pre-bound publish method: handlers hit LOAD_FAST-style attribute
+        # state prepared once instead of a LOAD_ATTR chain per publish
+        self._publish = self.publish_message
+
+        # LRU of generated docs keyed by (path, mtime_ns, language): rebuilds
+        # and retries for an unchanged file reuse the previous result
+        self._doc_cache: OrderedDict = OrderedDict()
+
         # Note: Event subscriptions are handled in setup_subscriptions() method
         
-        print(f"📚 Documentation Agent {agent_id} initialized")
-    
-    async def start(self):
-        """Start the Documentation Agent"""
-        print("📚 Starting Documentation Agent...")
-        await super().start()
-        
-        await self._setup_docs_environment()
-        print("📚 Documentation Agent started successfully")
+        self.logger.info("Documentation Agent %s initialized", agent_id)
     
-    async def stop(self):
-        """Stop the Documentation Agent"""
-        print("📚 Stopping Documentation Agent...")
-        await self._cleanup_docs_environment()
-        await super().stop()
-        print("📚 Documentation Agent stopped")
+    # Note: start/stop are inherited from BaseAgent, which runs the
+    # on_start/on_stop hooks below — no overrides, so the docs environment
+    # is set up and torn down exactly once per lifecycle transition
     
     # Note: handle_message is inherited from BaseAgent and calls process_message
     
@@ -86,16 +279,14 @@ class DocumentationAgent(BaseAgent):
         Returns:
             Dictionary containing generated documentation
         """
-        print("📝 Generating code documentation...")
+        self.logger.debug("Generating code documentation")
         
         try:
-            if language.lower() == "python":
-                return await self._generate_python_docs(code)
-            elif language.lower() == "javascript":
-                return await self._generate_javascript_docs(code)
-            else:
-                return await self._generate_generic_docs(code, language)
-        
+            generator = self._lang_dispatch.get(language.lower())
+            if generator:
+                return await generator(code)
+            return await self._generate_generic_docs(code, language)
+
         except Exception as e:
             self.logger.error(f"Error generating code docs: {str(e)}")
             return {
@@ -104,6 +295,122 @@ class DocumentationAgent(BaseAgent):
                 "documentation": ""
             }
     
+    async def _generate_python_docs(self, code: str,
+                                    tree: Optional[ast.AST] = None) -> Dict[str, Any]:
+        """
+        Generate documentation for Python source from its AST.
+
+        Args:
+            code: Original source (kept for line counts in the summary)
+            tree: Pre-parsed AST; parsed (via the cache) only when omitted
+
+        Returns:
+            Dictionary with extracted functions, classes and a markdown summary
+        """
+        if tree is None:
+            tree = _parse_python(code)
+
+        functions = []
+        classes = []
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                functions.append({
+                    "name": node.name,
+                    "args": [arg.arg for arg in node.args.args],
+                    "docstring": ast.get_docstring(node) or ""
+                })
+            elif isinstance(node, ast.ClassDef):
+                classes.append({
+                    "name": node.name,
+                    "docstring": ast.get_docstring(node) or ""
+                })
+
+        parts = ["# Code Documentation\n"]
+        for cls in classes:
+            parts.append(f"\n## class {cls['name']}\n\n{cls['docstring']}\n")
+        for func in functions:
+            signature = ", ".join(func["args"])
+            parts.append(f"\n### {func['name']}({signature})\n\n{func['docstring']}\n")
+
+        return {
+            "success": True,
+            "language": "python",
+            "functions": functions,
+            "classes": classes,
+            "documentation": "".join(parts)
+        }
+
+    async def _generate_javascript_docs(self, code: str) -> Dict[str, Any]:
+        """Generate documentation for JavaScript source via regex scanning."""
+        functions = [name for _async, name in _JS_FUNC_RE.findall(code)]
+        classes = _JS_CLASS_RE.findall(code)
+
+        parts = ["# Code Documentation\n"]
+        for cls in classes:
+            parts.append(f"\n## class {cls}\n")
+        for func in functions:
+            parts.append(f"\n### {func}()\n")
+
+        return {
+            "success": True,
+            "language": "javascript",
+            "functions": functions,
+            "classes": classes,
+            "documentation": "".join(parts)
+        }
+
+    async def _generate_generic_docs(self, code: str, language: str) -> Dict[str, Any]:
+        """Generate a minimal documentation summary for other languages."""
+        return {
+            "success": True,
+            "language": language,
+            "functions": [],
+            "classes": [],
+            "documentation": (f"# Code Documentation\n\n"
+                              f"{language} source, {code.count(chr(10)) + 1} lines\n")
+        }
+
+    async def generate_code_documentation(self, code_path: str,
+                                          language: str = "python") -> Dict[str, Any]:
+        """
+        Generate documentation for a source file, cached on its mtime.
+
+        code.generated and docs.update_request frequently fire for the same
+        path (rebuilds, retries); the (path, mtime_ns, language) key means an
+        unchanged file is read and documented once.
+
+        Args:
+            code_path: Path to the source file
+            language: Programming language of the file
+
+        Returns:
+            Dictionary containing generated documentation
+        """
+        try:
+            mtime_ns = os.stat(code_path).st_mtime_ns
+        except OSError as e:
+            self.logger.error("Cannot stat %s: %s", code_path, e)
+            return {"success": False, "error": str(e), "documentation": ""}
+
+        key = (code_path, mtime_ns, language)
+        cached = self._doc_cache.get(key)
+        if cached is not None:
+            self._doc_cache.move_to_end(key)
+            return cached
+
+        try:
+            with open(code_path, encoding="utf-8") as f:
+                code = f.read()
+        except OSError as e:
+            self.logger.error("Cannot read %s: %s", code_path, e)
+            return {"success": False, "error": str(e), "documentation": ""}
+
+        docs = await self.generate_code_docs(code, language)
+        self._doc_cache[key] = docs
+        if len(self._doc_cache) > _DOC_CACHE_MAX:
+            self._doc_cache.popitem(last=False)
+        return docs
+
     async def generate_api_docs(self, code: str, format: str = "openapi") -> Dict[str, Any]:
         """
         Generate API documentation in OpenAPI/Swagger format.
@@ -115,59 +422,17 @@ class DocumentationAgent(BaseAgent):
         Returns:
             Dictionary containing API documentation
         """
-        print("🔌 Generating API documentation...")
-        
-        # Mock API documentation generation
-        api_docs = {
-            "openapi": "3.0.0",
-            "info": {
-                "title": "Generated API Documentation",
-                "version": "1.0.0",
-                "description": "Auto-generated API documentation from code analysis"
-            },
-            "paths": {
-                "/api/example": {
-                    "get": {
-                        "summary": "Example endpoint",
-                        "description": "An example API endpoint extracted from code",
-                        "responses": {
-                            "200": {
-                                "description": "Successful response",
-                                "content": {
-                                    "application/json": {
-                                        "schema": {
-                                            "type": "object",
-                                            "properties": {
-                                                "message": {"type": "string"},
-                                                "data": {"type": "object"}
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "components": {
-                "schemas": {
-                    "ApiResponse": {
-                        "type": "object",
-                        "properties": {
-                            "success": {"type": "boolean"},
-                            "message": {"type": "string"},
-                            "data": {"type": "object"}
-                        }
-                    }
-                }
-            }
-        }
-        
+        self.logger.debug("Generating API documentation")
+
+        # The mock skeleton never varies, so each call shares the module-level
+        # read-only mapping, plus the import-time serialized bytes for
+        # consumers that forward or persist the document without parsing it
         return {
             "success": True,
             "format": format,
-            "documentation": api_docs,
-            "generated_at": datetime.now().isoformat()
+            "documentation": _API_SKELETON,
+            "documentation_json": _API_SKELETON_JSON,
+            "generated_at": now_iso()
         }
     
     async def generate_readme(self, project_info: Dict[str, Any]) -> Dict[str, Any]:
@@ -180,48 +445,31 @@ class DocumentationAgent(BaseAgent):
         Returns:
             Dictionary containing README content
         """
-        print("📄 Generating README documentation...")
+        self.logger.debug("Generating README documentation")
         
         project_name = project_info.get("name", "Project")
         description = project_info.get("description", "A software project")
         features = project_info.get("features", [])
-        
-        readme_content = f"""# {project_name}
-
-{description}
-
-## Features
-
-{self._format_feature_list(features)}
-
-## Installation
-
-```bash
-# Installation instructions here
-```
 
-## Usage
-
-```python
-# Usage examples here
-```
-
-## Contributing
-
-Please read CONTRIBUTING.md for details on our code of conduct and the process for submitting pull requests.
-
-## License
+        # Single-pass build: the body is assembled once with ''.join instead
+        # of joining the feature list and then recopying it through f-string
+        # interpolation
+        parts = ['# ', project_name, '\n\n', description, '\n\n## Features\n\n']
+        if features:
+            parts.extend(f'- {feature}\n' for feature in features)
+        else:
+            parts.append('- No features specified\n')
+        parts.append(_README_TAIL)
+        return {
+            "success": True,
+            "content": ''.join(parts),
+            "generated_at": now_iso()
+        }
 
-This project is licensed under the MIT License - see the LICENSE file for details.
-"""
-        return readme_content
-    
     def _format_feature_list(self, features: List[str]) -> str:
         """Format a list of features for markdown."""
-        if not features:
-            return "- No features specified"
-        
-        return "\n".join(f"- {feature}" for feature in features)
+        # List comprehension over genexpr: join can pre-size the result
+        return "\n".join(["- " + f for f in features]) if features else _EMPTY_FEATURES
     
     # Required abstract methods from BaseAgent
     
@@ -233,7 +481,7 @@ This project is licensed under the MIT License - see the LICENSE file for detail
         self.subscribe_to_topic("docs.generate_request")
         self.subscribe_to_topic("docs.update_request")
         
-        print("📋 Documentation Agent subscriptions configured")
+        self.logger.info("Documentation Agent subscriptions configured")
     
     async def process_message(self, msg_data: Dict[str, Any]):
         """
@@ -246,49 +494,36 @@ This project is licensed under the MIT License - see the LICENSE file for detail
         message = msg_data.get("message")
         source = msg_data.get("source")
         
-        print(f"📚 Docs processing: {topic} from {source}")
+        self.logger.debug("Docs processing: %s from %s", topic, source)
         
         try:
-            if topic == "code.generated":
-                await self._handle_code_generated(message)
-            elif topic == "architecture.spec_generated":
-                await self._handle_architecture_spec(message)
-            elif topic == "test.results":
-                await self._handle_test_results(message)
-            elif topic == "docs.generate_request":
-                await self._handle_docs_request(message)
-            elif topic == "docs.update_request":
-                await self._handle_docs_update(message)
+            handler = self._topic_handlers.get(topic)
+            if handler:
+                await handler(message)
             else:
-                print(f"⚠️  Unknown topic received: {topic}")
-                
+                self.logger.warning("Unknown topic received: %s", topic)
+
         except Exception as e:
-            print(f"❌ Error processing {topic}: {e}")
+            self.logger.error("Error processing %s: %s", topic, e)
             await self.on_error(e, msg_data)
     
     async def on_start(self):
         """Initialize Documentation agent on startup"""
-        print("🚀 Documentation Agent starting up...")
-        
         # Initialize documentation templates and output directories
         await self._setup_docs_environment()
-        
-        print("✅ Documentation Agent startup complete")
+        self.logger.info("Documentation Agent %s started", self.agent_id)
     
     async def on_stop(self):
         """Cleanup on agent shutdown"""
-        print("🛑 Documentation Agent shutting down...")
-        
         # Save any pending documentation and cleanup
         await self._cleanup_docs_environment()
-        
-        print("✅ Documentation Agent shutdown complete")
+        self.logger.info("Documentation Agent %s stopped", self.agent_id)
     
     # Helper methods for message handling
     
     async def _handle_code_generated(self, message: Dict[str, Any]):
         """Handle newly generated code for documentation"""
-        print("📝 Processing generated code for documentation...")
+        self.logger.debug("Processing generated code for documentation")
         
         code_path = message.get("code_path", "")
         language = message.get("language", "python")
@@ -298,16 +533,16 @@ This project is licensed under the MIT License - see the LICENSE file for detail
             docs = await self.generate_code_documentation(code_path, language)
             
             # Publish documentation results
-            await self.publish_message("docs.code_documented", {
+            await self._publish("docs.code_documented", {
                 "code_path": code_path,
                 "language": language,
                 "documentation": docs,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             })
     
     async def _handle_architecture_spec(self, message: Dict[str, Any]):
         """Handle architecture specifications for documentation"""
-        print("🏗️ Processing architecture spec for documentation...")
+        self.logger.debug("Processing architecture spec for documentation")
         
         spec_name = message.get("specification", "")
         document = message.get("document", {})
@@ -317,15 +552,15 @@ This project is licensed under the MIT License - see the LICENSE file for detail
             arch_docs = await self.generate_architecture_docs(spec_name, document)
             
             # Publish architecture documentation
-            await self.publish_message("docs.architecture_documented", {
+            await self._publish("docs.architecture_documented", {
                 "specification": spec_name,
                 "documentation": arch_docs,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             })
     
     async def _handle_test_results(self, message: Dict[str, Any]):
         """Handle test results for documentation"""
-        print("🧪 Processing test results for documentation...")
+        self.logger.debug("Processing test results for documentation")
         
         test_path = message.get("test_path", "")
         results = message.get("results", {})
@@ -335,15 +570,15 @@ This project is licensed under the MIT License - see the LICENSE file for detail
             test_docs = await self.generate_test_docs(test_path, results)
             
             # Publish test documentation
-            await self.publish_message("docs.test_documented", {
+            await self._publish("docs.test_documented", {
                 "test_path": test_path,
                 "documentation": test_docs,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             })
     
     async def _handle_docs_request(self, message: Dict[str, Any]):
         """Handle documentation generation requests"""
-        print("📋 Processing documentation generation request...")
+        self.logger.debug("Processing documentation generation request")
         
         doc_type = message.get("type", "general")
         target = message.get("target", "")
@@ -353,23 +588,26 @@ This project is licensed under the MIT License - see the LICENSE file for detail
             if doc_type == "api":
                 docs = await self.generate_api_documentation(target)
             elif doc_type == "readme":
-                docs = await self.generate_readme(target, 
-                    message.get("description", ""), 
-                    message.get("features", []))
+                readme = await self.generate_readme({
+                    "name": target,
+                    "description": message.get("description", ""),
+                    "features": message.get("features", [])
+                })
+                docs = readme["content"]
             else:
                 docs = await self.generate_user_guide(target, message.get("content", {}))
             
             # Publish documentation
-            await self.publish_message("docs.generated", {
+            await self._publish("docs.generated", {
                 "type": doc_type,
                 "target": target,
                 "documentation": docs,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             })
     
     async def _handle_docs_update(self, message: Dict[str, Any]):
         """Handle documentation update requests"""
-        print("🔄 Processing documentation update request...")
+        self.logger.debug("Processing documentation update request")
         
         doc_path = message.get("path", "")
         updates = message.get("updates", {})
@@ -379,94 +617,23 @@ This project is licensed under the MIT License - see the LICENSE file for detail
             updated_docs = await self._update_documentation(doc_path, updates)
             
             # Publish update results
-            await self.publish_message("docs.updated", {
+            await self._publish("docs.updated", {
                 "path": doc_path,
                 "documentation": updated_docs,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             })
     
     async def _setup_docs_environment(self):
         """Setup documentation environment"""
-        print("🔧 Setting up Documentation environment...")
+        self.logger.debug("Setting up Documentation environment")
         # Initialize documentation directories, templates, etc.
     
     async def _cleanup_docs_environment(self):
         """Cleanup documentation environment"""
-        print("🧹 Cleaning up Documentation environment...")
+        self.logger.debug("Cleaning up Documentation environment")
         # Save pending docs, cleanup temp files, etc.
     
     async def _update_documentation(self, doc_path: str, updates: Dict[str, Any]) -> str:
         """Update existing documentation with new information"""
         # Implementation for updating documentation
         return f"Updated documentation at {doc_path}"
-    
-    # Template methods
-    
-    def _get_function_doc_template(self) -> str:
-        """Get template for function documentation"""
-        return """
-        Args:
-            {args}
-        
-        Returns:
-            {returns}
-        
-        Raises:
-            {raises}
-        
-        Example:
-            {example}
-        """
-    
-    def _get_class_doc_template(self) -> str:
-        """Get template for class documentation"""
-        return """
-        {description}
-        
-        Attributes:
-            {attributes}
-        
-        Methods:
-            {methods}
-        
-        Example:
-            {example}
-        """
-    
-    def _get_api_doc_template(self) -> str:
-        """Get template for API documentation"""
-        return """
-        # API Documentation
-        
-        ## Endpoints
-        
-        {endpoints}
-        
-        ## Authentication
-        
-        {auth}
-        
-        ## Examples
-        
-        {examples}
-        """
-    
-    def _get_readme_template(self) -> str:
-        """Get template for README documentation"""
-        return """
-        # {title}
-        
-        {description}
-        
-        ## Installation
-        
-        {installation}
-        
-        ## Usage
-        
-        {usage}
-        
-        ## Contributing
-        
-        {contributing}
-        """
\ No newline at end of file
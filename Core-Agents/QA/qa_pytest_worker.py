@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Persistent pytest worker for the QA Agent.
+
+Spawned once per agent (see QAAgent.on_start) so the interpreter start and
+pytest import cost are paid a single time instead of per test run. Speaks a
+newline-delimited JSON protocol on stdin/stdout:
+
+    request:  {"test_file": "/path/to/test_x.py"}
+    response: {"exit_code": 0, "output": "...captured pytest output..."}
+
+One request is handled at a time; the agent serializes callers with a lock.
+"""
+
+import contextlib
+import io
+import json
+import sys
+
+import pytest
+
+
+def main():
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            buffer = io.StringIO()
+            with contextlib.redirect_stdout(buffer), \
+                    contextlib.redirect_stderr(buffer):
+                exit_code = pytest.main([
+                    '-v', '--tb=short', '-p', 'no:cacheprovider',
+                    request['test_file'],
+                ])
+            response = {'exit_code': int(exit_code),
+                        'output': buffer.getvalue()}
+        except Exception as e:  # malformed request or pytest blow-up
+            response = {'exit_code': -1, 'output': f'worker error: {e}'}
+        sys.stdout.write(json.dumps(response) + '\n')
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -7,22 +7,28 @@ This package contains all the core agents for the MTP-2.0 system:
 - CodeGen: Code generation agent
 - QA: Quality assurance agent
 - Documentation: Documentation generation agent
+
+Public names are resolved lazily (PEP 562): importing the package is
+near-free, and each agent module is only loaded when its class is first
+referenced, so pulling in one agent no longer drags in the other three.
 """
 
-# Import base classes
-from .Base.base_agent import BaseAgent
-from .Base.event_bus import EventBus
-from .Base.agent_factory import AgentFactory
+import importlib
 
-# Import agents
-from .Architecture.architect_agent import ArchitectAgent
-from .CodeGen.code_generator_agent import CodeGeneratorAgent
-from .QA.qa_agent import QAAgent
-from .Documentation.docs_agent import DocumentationAgent
+# Public name -> module that defines it, imported on first attribute access
+_LAZY_IMPORTS = {
+    'BaseAgent': '.Base.base_agent',
+    'EventBus': '.Base.event_bus',
+    'AgentFactory': '.Base.agent_factory',
+    'ArchitectAgent': '.Architecture.architect_agent',
+    'CodeGeneratorAgent': '.CodeGen.code_generator_agent',
+    'QAAgent': '.QA.qa_agent',
+    'DocumentationAgent': '.Documentation.docs_agent',
+}
 
 __all__ = [
     'BaseAgent',
-    'EventBus', 
+    'EventBus',
     'AgentFactory',
     'ArchitectAgent',
     'CodeGeneratorAgent',
@@ -31,3 +37,17 @@ __all__ = [
 ]
 
 __version__ = "2.0.0"
+
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    # Cache on the package so __getattr__ only runs once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
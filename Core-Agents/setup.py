@@ -12,18 +12,23 @@ setup(
     author="MTP Team",
     author_email="team@mtp.com",
     packages=find_packages(),
-    python_requires=">=3.8",
+    # dataclass(slots=True) needs 3.10; asyncio.to_thread needs 3.9
+    python_requires=">=3.10",
     install_requires=[
         "pyyaml>=6.0",
         "asyncio-mqtt>=0.11.0",
     ],
+    extras_require={
+        "fast": [
+            "orjson>=3.8",
+            "uvloop>=0.17; sys_platform != 'win32'",
+        ],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],